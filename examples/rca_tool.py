@@ -2,36 +2,58 @@
 
 from __future__ import annotations
 
-import argparse
+import io
 import json
 import os
 import re
+import sys
 from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 from x_make_graphviz_x import GraphvizBuilder
 from x_make_graphviz_x.vendor_support import find_vendored_dot_binary
 
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    _orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec as _msgspec
+except ImportError:  # pragma: no cover - optional accelerator
+    _msgspec = None  # type: ignore[assignment]
+
 MISSING_FISHBONE_ERROR = "payload missing 'fishbone' section"
 MISSING_PHASE_FLOW_ERROR = "payload missing 'phase_flow' section"
 ENV_EVIDENCE_ROOT = "MAKE_GRAPHVIZ_EVIDENCE_ROOT"
 FALLBACK_RELEASE = "0.20.15"
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
 
 
 @dataclass(frozen=True)
-class Branch:
-    name: str
-    description: str
-    sub_causes: list[str]
-
-
-@dataclass(frozen=True)
-class Phase:
-    title: str
-    goal: str
-    exit: str
-    tactics: str
+class Payload:
+    incident: dict[str, object]
+    fishbone: dict[str, object]
+    phase_flow: dict[str, object]
+    backlog: list[dict[str, object]]
+    actions: list[dict[str, object]]
+
+    @classmethod
+    def from_raw(cls, raw: Mapping[str, object]) -> Payload:
+        return cls(
+            incident=_coerce_mapping(raw.get("incident")),
+            fishbone=_coerce_mapping(raw.get("fishbone")),
+            phase_flow=_coerce_mapping(raw.get("phase_flow")),
+            backlog=_coerce_mapping_list(raw.get("backlog")),
+            actions=_coerce_mapping_list(raw.get("actions")),
+        )
 
 
 @dataclass(frozen=True)
@@ -63,17 +85,13 @@ class RenderPlan:
     defaulted_subdir: bool
     defaulted_markdown_path: bool
 
-    @property
-    def artifact_root(self) -> Path:
-        if self.subdir:
-            return self.output_dir / self.subdir
-        return self.output_dir
-
 
+@cache
 def _workspace_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@lru_cache(maxsize=512)
 def _parse_release(name: str) -> tuple[int, ...] | None:
     parts = name.split(".")
     if not parts:
@@ -85,25 +103,31 @@ def _parse_release(name: str) -> tuple[int, ...] | None:
 
 
 def _latest_release_dir(base: Path) -> Path | None:
-    if not base.exists():
+    best: tuple[tuple[int, ...], str] | None = None
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                version = _parse_release(entry.name)
+                if version is not None and (best is None or version > best[0]):
+                    best = (version, entry.path)
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    candidates: list[tuple[tuple[int, ...], Path]] = []
-    for entry in base.iterdir():
-        if not entry.is_dir():
-            continue
-        version = _parse_release(entry.name)
-        if version is not None:
-            candidates.append((version, entry))
-    if not candidates:
+    if best is None:
         return None
-    candidates.sort(key=lambda item: item[0], reverse=True)
-    return candidates[0][1]
+    return Path(best[1])
 
 
 def _default_evidence_root() -> Path:
     override = os.environ.get(ENV_EVIDENCE_ROOT)
     if override:
         return Path(override)
+    return _discovered_evidence_root()
+
+
+@cache
+def _discovered_evidence_root() -> Path:
     workspace_root = _workspace_root()
     search_roots = [
         workspace_root / "x_0_make_all_x" / "Change Control",
@@ -127,14 +151,13 @@ _NON_SEQUENCE_TYPES = (str, bytes, bytearray)
 
 
 def _coerce_mapping(value: object | None) -> dict[str, object]:
+    if type(value) is dict and all(type(key) is str for key in value):
+        # JSON objects already have str keys; callers treat the result as read-only.
+        return cast("dict[str, object]", value)
     if isinstance(value, Mapping):
-        result: dict[str, object] = {}
-        for key, entry in value.items():
-            if isinstance(key, str):
-                result[key] = entry
-            else:
-                result[str(key)] = entry
-        return result
+        return {
+            key if type(key) is str else str(key): entry for key, entry in value.items()
+        }
     return {}
 
 
@@ -162,18 +185,31 @@ def _coerce_optional_str(value: object | None) -> str | None:
 
 def _coerce_str_list(value: object | None) -> list[str]:
     if isinstance(value, Sequence) and not isinstance(value, _NON_SEQUENCE_TYPES):
-        return [item if isinstance(item, str) else str(item) for item in value]
+        if type(value) is list and all(type(item) is str for item in value):
+            # Already list[str] (the common JSON case); callers treat it as read-only.
+            return cast("list[str]", value)
+        return [item if type(item) is str else str(item) for item in value]
     return []
 
 
 def _slugify(value: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", "-", value.strip().lower())
+    cleaned = _SLUG_RE.sub("-", value.strip().lower())
     return cleaned.strip("-") or "rca"
 
 
+def _loads(raw: bytes) -> object:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    if _msgspec is not None:
+        try:
+            return _msgspec.json.decode(raw)
+        except _msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+    return json.loads(raw)
+
+
 def _load_payload(path: Path) -> dict[str, object]:
-    text = path.read_text(encoding="utf-8")
-    data = json.loads(text)
+    data = _loads(path.read_bytes())
     if isinstance(data, Mapping):
         result: dict[str, object] = {}
         for key, entry in data.items():
@@ -196,7 +232,9 @@ def _coerce_dot_binary(dot_binary: Path | str | None) -> str | None:
 
 
 def _build_phase_flow(
-    phases: list[Phase], *, dot_binary: Path | str | None = None
+    phases: Iterable[Mapping[str, object]],
+    *,
+    dot_binary: Path | str | None = None,
 ) -> GraphvizBuilder:
     builder = GraphvizBuilder(directed=True, dot_binary=_coerce_dot_binary(dot_binary))
     builder.graph_attr(rankdir="LR")
@@ -217,10 +255,12 @@ def _build_phase_flow(
     previous = "start"
     for idx, phase in enumerate(phases, start=1):
         node_id = f"phase_{idx}"
-        label_lines = [phase.title]
-        if phase.goal:
-            label_lines.append(phase.goal)
-        builder.add_node(node_id, label="\n".join(label_lines))
+        title = phase.get("title")
+        goal = phase.get("goal")
+        label = title if type(title) is str else "Phase"
+        if type(goal) is str and goal:
+            label = f"{label}\n{goal}"
+        builder.add_node(node_id, label=label)
         builder.add_edge(previous, node_id)
         previous = node_id
         phase_ids.append(node_id)
@@ -238,7 +278,10 @@ def _build_phase_flow(
 
 
 def _build_ishikawa(
-    effect: str, branches: list[Branch], *, dot_binary: Path | str | None = None
+    effect: str,
+    branches: Iterable[Mapping[str, object]],
+    *,
+    dot_binary: Path | str | None = None,
 ) -> GraphvizBuilder:
     builder = GraphvizBuilder(directed=True, dot_binary=_coerce_dot_binary(dot_binary))
     builder.graph_attr(rankdir="LR", splines="ortho")
@@ -252,53 +295,48 @@ def _build_ishikawa(
         fillcolor="#ffe9cc",
     )
 
+    node_ids: list[str] = []
+    labels: list[str | None] = []
+    edges: list[tuple[str, str]] = []
     for branch in branches:
-        branch_id = _slugify(branch.name)
-        branch_label = branch.name
-        if branch.description:
-            branch_label = f"{branch.name}\n{branch.description}"
-        builder.add_node(branch_id, label=branch_label)
-        builder.add_edge(branch_id, "effect")
-        for idx, cause in enumerate(branch.sub_causes, start=1):
+        get = branch.get
+        name = get("title")
+        description = get("description")
+        if type(name) is not str:
+            name = "Unnamed Branch"
+        branch_id = _slugify(name)
+        branch_label = name
+        if type(description) is str and description:
+            branch_label = f"{name}\n{description}"
+        node_ids.append(branch_id)
+        labels.append(branch_label)
+        edges.append((branch_id, "effect"))
+        for idx, cause in enumerate(_coerce_str_list(get("sub_causes")), start=1):
             cause_id = f"{branch_id}_{idx}"
-            builder.add_node(cause_id, label=cause)
-            builder.add_edge(branch_id, cause_id)
+            node_ids.append(cause_id)
+            labels.append(cause)
+            edges.append((branch_id, cause_id))
+    builder.add_nodes_batch(node_ids, labels)
+    builder.add_edges_batch(edges)
     return builder
 
 
-def _export(builder: GraphvizBuilder, basename: Path) -> tuple[str, Path, Path | None]:
+def _artifact_basename(plan: RenderPlan, name: str) -> str:
+    return os.path.join(plan.output_dir, plan.subdir or "", name)
+
+
+def _export(builder: GraphvizBuilder, basename: str) -> tuple[str, Path, Path | None]:
     dot_source = builder.dot_source()
-    dot_path = basename.with_suffix(".dot")
+    dot_path = Path(basename + ".dot")
     dot_path.parent.mkdir(parents=True, exist_ok=True)
-    dot_path.write_text(dot_source, encoding="utf-8")
-    svg_path_str = builder.to_svg(str(basename))
+    dot_path.write_bytes(dot_source.encode("utf-8"))
+    # to_svg strips any suffix to find the stem, so hand it the full SVG name;
+    # otherwise a dotted slug like "rel-1.2" would lose everything after the dot.
+    svg_path_str = builder.to_svg(basename + ".svg", dot_source=dot_source)
     svg_path = Path(svg_path_str) if svg_path_str else None
     return dot_source, dot_path, svg_path
 
 
-def _as_branches(raw: Iterable[Mapping[str, object]]) -> list[Branch]:
-    return [
-        Branch(
-            name=_coerce_str(item.get("title"), "Unnamed Branch"),
-            description=_coerce_str(item.get("description")),
-            sub_causes=_coerce_str_list(item.get("sub_causes")),
-        )
-        for item in raw
-    ]
-
-
-def _as_phases(raw: Iterable[Mapping[str, object]]) -> list[Phase]:
-    return [
-        Phase(
-            title=_coerce_str(item.get("title"), "Phase"),
-            goal=_coerce_str(item.get("goal")),
-            exit=_coerce_str(item.get("exit")),
-            tactics=_coerce_str(item.get("tactics")),
-        )
-        for item in raw
-    ]
-
-
 def _graphviz_block(name: str, dot_source: str) -> str:
     return f"```graphviz name={name} hook=diagram.graphviz\n{dot_source.strip()}\n```"
 
@@ -306,25 +344,25 @@ def _graphviz_block(name: str, dot_source: str) -> str:
 def _make_image_ref(
     images_prefix: str | None, subdir: str | None, filename: str
 ) -> str:
-    parts: list[str] = []
+    if images_prefix and subdir:
+        return f"{images_prefix}/{subdir}/{filename}"
     if images_prefix:
-        parts.append(images_prefix)
+        return f"{images_prefix}/{filename}"
     if subdir:
-        parts.append(subdir)
-    parts.append(filename)
-    return "/".join(part for part in parts if part)
+        return f"{subdir}/{filename}"
+    return filename
 
 
 def _markdown(
-    payload: Mapping[str, object],
+    payload: Payload,
     slug: str,
     *,
     artifacts: MarkdownArtifacts,
 ) -> str:
-    incident = _coerce_mapping(payload.get("incident"))
-    phase_flow = _coerce_mapping(payload.get("phase_flow"))
-    backlog_items = _coerce_mapping_list(payload.get("backlog"))
-    action_items = _coerce_mapping_list(payload.get("actions"))
+    incident = payload.incident
+    phase_flow = payload.phase_flow
+    backlog_items = payload.backlog
+    action_items = payload.actions
     title = _coerce_str(incident.get("title"), "Root Cause Analysis")
     summary = _coerce_str(incident.get("summary"), _coerce_str(incident.get("effect")))
     context_items = _coerce_mapping(incident.get("context"))
@@ -336,72 +374,74 @@ def _markdown(
         artifacts.images_prefix, artifacts.subdir, f"{slug}-ishikawa.svg"
     )
 
-    lines: list[str] = [f"# {title}", "", summary, ""]
+    buffer = io.StringIO()
+    write = buffer.write
+    write(f"# {title}".rstrip())
+    write("\n\n")
+    write(summary.rstrip())
+    write("\n")
 
     if context_items:
-        lines.append("## Operational Context")
+        write("\n## Operational Context\n")
         for key, value in context_items.items():
             value_str = _coerce_str(value)
-            lines.append(f"- **{key}**: {value_str}")
-        lines.append("")
+            write(f"- **{key}**: {value_str}".rstrip())
+            write("\n")
 
-    lines.append("## Phase Flow (Rendered)")
-    lines.append(f"![Phase Flow]({phase_img})")
-    lines.append("")
-    lines.append(_graphviz_block("phase_flow", artifacts.phase_dot))
-    lines.append("")
+    write("\n## Phase Flow (Rendered)\n")
+    write(f"![Phase Flow]({phase_img})\n\n")
+    write(_graphviz_block("phase_flow", artifacts.phase_dot))
+    write("\n")
 
-    lines.append("## Ishikawa Diagram (Rendered)")
-    lines.append(f"![Ishikawa]({ishikawa_img})")
-    lines.append("")
-    lines.append(_graphviz_block("ishikawa", artifacts.ishikawa_dot))
-    lines.append("")
+    write("\n## Ishikawa Diagram (Rendered)\n")
+    write(f"![Ishikawa]({ishikawa_img})\n\n")
+    write(_graphviz_block("ishikawa", artifacts.ishikawa_dot))
+    write("\n")
 
     phases_section = _coerce_mapping_list(phase_flow.get("phases"))
     if phases_section:
-        lines.append("## Phase Detail")
-        lines.append("| Phase | Exit Criteria | Primary Tactics |")
-        lines.append("| --- | --- | --- |")
-        lines.extend(
-            "| {title} | {exit} | {tactics} |".format(
-                title=_coerce_str(phase.get("title"), "Phase"),
-                exit=_coerce_str(phase.get("exit")),
-                tactics=_coerce_str(phase.get("tactics")),
+        write("\n## Phase Detail\n")
+        write("| Phase | Exit Criteria | Primary Tactics |\n")
+        write("| --- | --- | --- |\n")
+        for phase in phases_section:
+            phase_row = (
+                _coerce_str(phase.get("title"), "Phase"),
+                _coerce_str(phase.get("exit")),
+                _coerce_str(phase.get("tactics")),
             )
-            for phase in phases_section
-        )
-        lines.append("")
+            write("| " + " | ".join(phase_row) + " |\n")
 
     if backlog_items:
-        lines.append("## Immediate Backlog")
+        write("\n## Immediate Backlog\n")
         for item in backlog_items:
             owner = _coerce_str(item.get("owner"))
             status = _coerce_str(item.get("status"))
             prefix = f"[{status}] " if status else ""
             suffix = f" — {owner}" if owner else ""
-            lines.append(f"- {prefix}{_coerce_str(item.get('item'))}{suffix}")
-        lines.append("")
+            entry = f"- {prefix}{_coerce_str(item.get('item'))}{suffix}"
+            write(entry.rstrip())
+            write("\n")
 
     if action_items:
-        lines.append("## Remediation Tracker")
-        lines.append("| Item | Owner | Status | ETA | Notes |")
-        lines.append("| --- | --- | --- | --- | --- |")
-        lines.extend(
-            "| {item} | {owner} | {status} | {eta} | {notes} |".format(
-                item=_coerce_str(action.get("item")),
-                owner=_coerce_str(action.get("owner")),
-                status=_coerce_str(action.get("status")),
-                eta=_coerce_str(action.get("eta")),
-                notes=_coerce_str(action.get("notes")),
+        write("\n## Remediation Tracker\n")
+        write("| Item | Owner | Status | ETA | Notes |\n")
+        write("| --- | --- | --- | --- | --- |\n")
+        for action in action_items:
+            action_row = (
+                _coerce_str(action.get("item")),
+                _coerce_str(action.get("owner")),
+                _coerce_str(action.get("status")),
+                _coerce_str(action.get("eta")),
+                _coerce_str(action.get("notes")),
             )
-            for action in action_items
-        )
-        lines.append("")
+            write("| " + " | ".join(action_row) + " |\n")
 
-    return "\n".join(line.rstrip() for line in lines if line is not None)
+    return buffer.getvalue()
 
 
 def _build_parser() -> argparse.ArgumentParser:
+    import argparse  # deferred until the CLI actually runs
+
     parser = argparse.ArgumentParser(description="Root Cause Analysis automation")
     parser.add_argument(
         "--input",
@@ -488,48 +528,65 @@ def _resolve_render_plan(slug: str, options: CLIOptions) -> RenderPlan:
     )
 
 
-def _log_plan_defaults(plan: RenderPlan) -> None:
+def _plan_default_messages(plan: RenderPlan) -> list[str]:
+    messages: list[str] = []
     if plan.defaulted_output_dir:
-        print(
+        messages.append(
             "[rca_tool] --output-dir not supplied; defaulting to"
             f" {plan.output_dir}. Override via --output-dir or set {ENV_EVIDENCE_ROOT}.",
         )
     if plan.defaulted_subdir:
-        print(
+        messages.append(
             "[rca_tool] using slug-based sub-directory"
             f" '{plan.subdir}' to isolate artifacts.",
         )
     if plan.defaulted_markdown_path and plan.markdown_path:
-        print(
+        messages.append(
             "[rca_tool] --markdown-path not supplied; writing markdown to"
             f" {plan.markdown_path}.",
         )
+    return messages
+
+
+def _export_messages(
+    kind: str, dot_path: Path, svg_path: Path | None
+) -> tuple[str, str]:
+    if svg_path:
+        return f"wrote {dot_path}", f"wrote {svg_path}"
+    return f"wrote {dot_path}", f"dot binary missing; {kind} SVG not created"
+
+
+def _write_lines(lines: Sequence[str]) -> None:
+    # One write and flush per batch instead of a print() per line.
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     parser, options = _parse_cli_options(argv)
 
     try:
-        payload = _load_payload(options.input_path)
+        payload = Payload.from_raw(_load_payload(options.input_path))
     except ValueError as exc:
         parser.error(str(exc))
 
-    incident = _coerce_mapping(payload.get("incident"))
+    incident = payload.incident
     slug = (
         options.slug_override
         or _coerce_str(incident.get("slug"))
         or _slugify(_coerce_str(incident.get("title"), "root-cause"))
     )
 
-    fishbone = _coerce_mapping(payload.get("fishbone"))
+    fishbone = payload.fishbone
     if not fishbone:
         raise SystemExit(MISSING_FISHBONE_ERROR)
-    phase_flow = _coerce_mapping(payload.get("phase_flow"))
+    phase_flow = payload.phase_flow
     if not phase_flow:
         raise SystemExit(MISSING_PHASE_FLOW_ERROR)
 
-    branches = _as_branches(_coerce_mapping_list(fishbone.get("branches")))
-    phases = _as_phases(_coerce_mapping_list(phase_flow.get("phases")))
+    branches = _coerce_mapping_list(fishbone.get("branches"))
+    phases = _coerce_mapping_list(phase_flow.get("phases"))
     effect = (
         _coerce_str(fishbone.get("effect"))
         or _coerce_str(incident.get("effect"))
@@ -537,27 +594,28 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
 
     plan = _resolve_render_plan(slug, options)
-    _log_plan_defaults(plan)
+    # Surface the defaults before exporting so they show even if an export fails.
+    _write_lines(_plan_default_messages(plan))
 
     phase_builder = _build_phase_flow(phases, dot_binary=options.dot_binary)
-    phase_dot, phase_dot_path, phase_svg_path = _export(
-        phase_builder, plan.artifact_root / f"{slug}-phase-flow"
-    )
-    print(f"wrote {phase_dot_path}")
-    if phase_svg_path:
-        print(f"wrote {phase_svg_path}")
-    else:
-        print("dot binary missing; phase SVG not created")
-
     ish_builder = _build_ishikawa(effect, branches, dot_binary=options.dot_binary)
-    ish_dot, ish_dot_path, ish_svg_path = _export(
-        ish_builder, plan.artifact_root / f"{slug}-ishikawa"
+    # Each export waits on its own dot subprocess, so run the two side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        phase_future = executor.submit(
+            _export, phase_builder, _artifact_basename(plan, f"{slug}-phase-flow")
+        )
+        ish_future = executor.submit(
+            _export, ish_builder, _artifact_basename(plan, f"{slug}-ishikawa")
+        )
+        phase_dot, phase_dot_path, phase_svg_path = phase_future.result()
+        ish_dot, ish_dot_path, ish_svg_path = ish_future.result()
+
+    _write_lines(
+        [
+            *_export_messages("phase", phase_dot_path, phase_svg_path),
+            *_export_messages("ishikawa", ish_dot_path, ish_svg_path),
+        ]
     )
-    print(f"wrote {ish_dot_path}")
-    if ish_svg_path:
-        print(f"wrote {ish_svg_path}")
-    else:
-        print("dot binary missing; ishikawa SVG not created")
 
     if options.emit_markdown or plan.markdown_path:
         markdown = _markdown(
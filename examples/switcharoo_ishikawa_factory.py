@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
-import argparse
-from dataclasses import dataclass, field
+import os
+import shutil
+import subprocess
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache, lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from x_make_graphviz_x import GraphvizBuilder
 
 if TYPE_CHECKING:
+    import argparse
     from collections.abc import Iterable, Sequence
 
 AttrValue = str | int | float | bool | None
+AttrPairs = tuple[tuple[str, AttrValue], ...]
+# Spec fields also take a plain mapping; it is frozen to pairs on construction.
+AttrInput = AttrPairs | Mapping[str, AttrValue]
+
+
+def _freeze_attrs(attrs: AttrInput) -> AttrPairs:
+    if type(attrs) is tuple:
+        return attrs
+    if isinstance(attrs, Mapping):
+        # Keep insertion order: it is the attribute order emitted in the DOT.
+        return tuple(attrs.items())
+    return tuple(attrs)
 
 
 def _pop_port(attrs: dict[str, AttrValue], key: str) -> str | None:
@@ -28,7 +46,10 @@ def _pop_port(attrs: dict[str, AttrValue], key: str) -> str | None:
 class NodeSpec:
     node_id: str
     label: str | None = None
-    attributes: dict[str, AttrValue] = field(default_factory=dict)
+    attributes: AttrInput = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "attributes", _freeze_attrs(self.attributes))
 
 
 @dataclass(frozen=True)
@@ -36,22 +57,36 @@ class EdgeSpec:
     source: str
     target: str
     label: str | None = None
-    attributes: dict[str, AttrValue] = field(default_factory=dict)
+    attributes: AttrInput = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "attributes", _freeze_attrs(self.attributes))
 
 
 @dataclass(frozen=True)
 class DiagramSpec:
     name: str
     filename: str
-    graph_attrs: dict[str, AttrValue] = field(default_factory=dict)
+    graph_attrs: AttrInput = ()
     directed: bool = True
-    nodes: Sequence[NodeSpec] = field(default_factory=tuple)
-    edges: Sequence[EdgeSpec] = field(default_factory=tuple)
-    node_defaults: dict[str, AttrValue] = field(default_factory=dict)
-    edge_defaults: dict[str, AttrValue] = field(default_factory=dict)
-    rank_groups: Sequence[Sequence[str]] = field(default_factory=tuple)
+    nodes: Sequence[NodeSpec] = ()
+    edges: Sequence[EdgeSpec] = ()
+    node_defaults: AttrInput = ()
+    edge_defaults: AttrInput = ()
+    rank_groups: Sequence[Sequence[str]] = ()
+
+    def __post_init__(self) -> None:
+        # Freeze every field so specs stay hashable for _dot_source_for's cache.
+        for name in ("graph_attrs", "node_defaults", "edge_defaults"):
+            object.__setattr__(self, name, _freeze_attrs(getattr(self, name)))
+        object.__setattr__(self, "nodes", tuple(self.nodes))
+        object.__setattr__(self, "edges", tuple(self.edges))
+        object.__setattr__(
+            self, "rank_groups", tuple(tuple(group) for group in self.rank_groups)
+        )
 
 
+@lru_cache(maxsize=8)
 def _coerce_dot_binary(dot_binary: Path | str | None) -> str | None:
     if dot_binary is None:
         return None
@@ -72,15 +107,21 @@ def _build_diagram(
         directed=spec.directed, dot_binary=_coerce_dot_binary(dot_binary)
     )
     if spec.graph_attrs:
-        builder.graph_attr(**spec.graph_attrs)
+        builder.graph_attr(**dict(spec.graph_attrs))
     if spec.node_defaults:
-        builder.node_defaults(**spec.node_defaults)
+        builder.node_defaults(**dict(spec.node_defaults))
     if spec.edge_defaults:
-        builder.edge_defaults(**spec.edge_defaults)
+        builder.edge_defaults(**dict(spec.edge_defaults))
     for node in spec.nodes:
-        builder.add_node(node.node_id, label=node.label, **node.attributes)
+        if node.attributes:
+            builder.add_node(node.node_id, label=node.label, **dict(node.attributes))
+        else:
+            builder.add_node(node.node_id, label=node.label)
     _apply_rank_groups(builder, spec.rank_groups)
     for edge in spec.edges:
+        if not edge.attributes:
+            builder.add_edge(edge.source, edge.target, label=edge.label)
+            continue
         attrs = dict(edge.attributes)
         from_port = _pop_port(attrs, "from_port")
         to_port = _pop_port(attrs, "to_port")
@@ -95,20 +136,139 @@ def _build_diagram(
     return builder
 
 
-def _export_spec(
-    spec: DiagramSpec,
-    output_dir: Path,
+@lru_cache(maxsize=32)
+def _dot_source_for(spec: DiagramSpec) -> str:
+    """Return the DOT source for ``spec``; specs are immutable, so it is cached."""
+    return _build_diagram(spec).dot_source()
+
+
+def _rendered_svg(dot_path: Path, dot_bytes: bytes) -> Path | None:
+    """Return the existing SVG when ``dot_path`` already holds ``dot_bytes``."""
+    svg_path = dot_path.with_suffix(".svg")
+    try:
+        unchanged = dot_path.read_bytes() == dot_bytes
+    except OSError:
+        return None
+    if unchanged and svg_path.exists():
+        return svg_path
+    return None
+
+
+def _render_batch(
+    dot_binary: str, dot_paths: Sequence[Path]
+) -> tuple[list[Path | None], str | None]:
+    """Render every DOT file to SVG with a single ``dot -O`` process.
+
+    Returns one SVG path per input (``None`` when dot produced nothing) and, when
+    dot could not be run or exited non-zero, its error output.
+    """
+    command = [dot_binary, "-Tsvg", "-O", *(str(path) for path in dot_paths)]
+    # -O names each output after its input file, e.g. diagram.dot.svg; clear
+    # leftovers so only files this run produced are picked up below.
+    for dot_path in dot_paths:
+        Path(f"{dot_path}.svg").unlink(missing_ok=True)
+    try:
+        completed = subprocess.run(  # fixed argv, no shell
+            command, capture_output=True, text=True, check=False
+        )
+    except OSError as exc:
+        return [None] * len(dot_paths), f"dot failed: {exc}"
+    error: str | None = None
+    if completed.returncode != 0:
+        detail = completed.stderr.strip() or f"exit status {completed.returncode}"
+        error = f"dot failed: {detail}"
+    svg_paths: list[Path | None] = []
+    for dot_path in dot_paths:
+        rendered = Path(f"{dot_path}.svg")
+        if not rendered.exists():
+            svg_paths.append(None)
+            continue
+        svg_path = dot_path.with_suffix(".svg")
+        rendered.replace(svg_path)
+        svg_paths.append(svg_path)
+    return svg_paths, error
+
+
+def _export_single(
+    written: tuple[DiagramSpec, str, Path],
     *,
     dot_binary: Path | str | None = None,
-) -> tuple[str, Path, Path | None]:
+) -> Path | None:
+    spec, dot_source, dot_path = written
     builder = _build_diagram(spec, dot_binary=dot_binary)
-    dot_source = builder.dot_source()
+    svg_path_str = builder.to_svg(str(dot_path.with_suffix("")), dot_source=dot_source)
+    # The exporter rewrites the DOT in text mode; restore the exact bytes the
+    # unchanged-source check compares against on the next run.
+    dot_path.write_bytes(dot_source.encode("utf-8"))
+    return Path(svg_path_str) if svg_path_str else None
+
+
+_ExportRow = tuple[str, Path, Path | None, str | None]
+
+
+def _export_specs(
+    specs: Sequence[DiagramSpec],
+    output_dir: Path,
+    *,
+    dot_binary: Path | str | None = None,
+) -> list[_ExportRow]:
+    """Write and render ``specs``; each row ends with the failure reason, if any."""
     output_dir.mkdir(parents=True, exist_ok=True)
-    dot_path = output_dir / f"{spec.filename}.dot"
-    dot_path.write_text(dot_source, encoding="utf-8")
-    svg_path_str = builder.to_svg(str(output_dir / spec.filename))
-    svg_path = Path(svg_path_str) if svg_path_str else None
-    return dot_source, dot_path, svg_path
+    results: list[_ExportRow] = []
+    written: list[tuple[DiagramSpec, str, Path]] = []
+    pending: list[int] = []
+    for spec in specs:
+        dot_source = _dot_source_for(spec)
+        dot_bytes = dot_source.encode("utf-8")
+        dot_path = output_dir / f"{spec.filename}.dot"
+        # Unchanged sources with an SVG on disk skip both the write and dot.
+        svg_path = _rendered_svg(dot_path, dot_bytes)
+        results.append((dot_source, dot_path, svg_path, None))
+        if svg_path is None:
+            # Drop the old SVG first so a failed render cannot leave it paired
+            # with the new DOT and be mistaken for an up-to-date render later.
+            dot_path.with_suffix(".svg").unlink(missing_ok=True)
+            dot_path.write_bytes(dot_bytes)
+            pending.append(len(results) - 1)
+            written.append((spec, dot_source, dot_path))
+    if not written:
+        return results
+    binary = _coerce_dot_binary(dot_binary) or shutil.which("dot")
+    # Rendering waits on dot subprocesses, so spread the work over a thread pool.
+    workers = min(len(written), os.cpu_count() or 1)
+    svg_paths: list[Path | None] = []
+    errors: list[str | None] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        if binary is not None:
+            dot_paths = [dot_path for _, _, dot_path in written]
+            size = -(-len(dot_paths) // workers)
+            batches = [
+                dot_paths[start : start + size]
+                for start in range(0, len(dot_paths), size)
+            ]
+            for batch_svgs, batch_error in executor.map(
+                partial(_render_batch, binary), batches
+            ):
+                svg_paths.extend(batch_svgs)
+                errors.extend([batch_error] * len(batch_svgs))
+        else:
+            svg_paths = [None] * len(written)
+            errors = ["dot binary missing"] * len(written)
+        # Only diagrams whose dot -O output is missing go through the shared
+        # exporter, which owns runner injection and the ExportResult bookkeeping.
+        retry = [index for index, svg_path in enumerate(svg_paths) if svg_path is None]
+        export = partial(_export_single, dot_binary=dot_binary)
+        retried = executor.map(export, [written[index] for index in retry])
+        for index, svg_path in zip(retry, retried, strict=True):
+            svg_paths[index] = svg_path
+    for index, svg_path, error in zip(pending, svg_paths, errors, strict=True):
+        dot_source, dot_path, _, _ = results[index]
+        if svg_path is not None:
+            error = None
+        elif error is None:
+            error = "dot export failed"
+        results[index] = (dot_source, dot_path, svg_path, error)
+    return results
 
 
 def _markdown_block(name: str, dot_source: str) -> str:
@@ -119,27 +279,28 @@ def _markdown_block(name: str, dot_source: str) -> str:
     )
 
 
+@cache
 def _phase_flow_spec() -> DiagramSpec:
     return DiagramSpec(
         name="switcharoo_phase_flow",
         filename="switcharoo-phase-flow",
-        graph_attrs={"rankdir": "LR"},
-        node_defaults={
-            "shape": "box",
-            "style": "rounded,filled",
-            "fillcolor": "#e8f4fd",
-            "fontname": "Inter",
-        },
+        graph_attrs=(("rankdir", "LR"),),
+        node_defaults=(
+            ("shape", "box"),
+            ("style", "rounded,filled"),
+            ("fillcolor", "#e8f4fd"),
+            ("fontname", "Inter"),
+        ),
         nodes=(
             NodeSpec(
                 "start",
                 label="",
-                attributes={
-                    "shape": "circle",
-                    "width": 0.3,
-                    "style": "filled",
-                    "fillcolor": "#1f78b4",
-                },
+                attributes=(
+                    ("shape", "circle"),
+                    ("width", 0.3),
+                    ("style", "filled"),
+                    ("fillcolor", "#1f78b4"),
+                ),
             ),
             NodeSpec("A", label="Phase A\nEvidence Integrity"),
             NodeSpec("B", label="Phase B\nTemplate Validation"),
@@ -148,7 +309,7 @@ def _phase_flow_spec() -> DiagramSpec:
             NodeSpec(
                 "end",
                 label="Green",
-                attributes={"shape": "doublecircle", "fillcolor": "#c1f2c7"},
+                attributes=(("shape", "doublecircle"), ("fillcolor", "#c1f2c7")),
             ),
         ),
         edges=(
@@ -162,17 +323,18 @@ def _phase_flow_spec() -> DiagramSpec:
     )
 
 
+@cache
 def _ishikawa_spec() -> DiagramSpec:
     nodes: list[NodeSpec] = [
         NodeSpec(
             "effect",
             label="Digest stale\n(Nov snapshot after Dec run)",
-            attributes={
-                "shape": "ellipse",
-                "style": "filled",
-                "fillcolor": "#ffe9cc",
-                "fontname": "Inter",
-            },
+            attributes=(
+                ("shape", "ellipse"),
+                ("style", "filled"),
+                ("fillcolor", "#ffe9cc"),
+                ("fontname", "Inter"),
+            ),
         ),
         NodeSpec("data", label="Data Inputs\ncontext/json not refreshed"),
         NodeSpec("template", label="Template Logic\nstatic summary text"),
@@ -216,14 +378,29 @@ def _ishikawa_spec() -> DiagramSpec:
     return DiagramSpec(
         name="switcharoo_ishikawa",
         filename="switcharoo-ishikawa",
-        graph_attrs={"rankdir": "LR", "splines": "ortho"},
-        node_defaults={"shape": "box", "style": "rounded", "fontname": "Inter"},
+        graph_attrs=(("rankdir", "LR"), ("splines", "ortho")),
+        node_defaults=(("shape", "box"), ("style", "rounded"), ("fontname", "Inter")),
         nodes=tuple(nodes),
         edges=tuple(edges),
     )
 
 
-SPECS: tuple[DiagramSpec, ...] = (_phase_flow_spec(), _ishikawa_spec())
+if TYPE_CHECKING:
+    # Bound lazily by the module __getattr__ below.
+    SPECS: tuple[DiagramSpec, ...]
+
+
+@cache
+def _specs() -> tuple[DiagramSpec, ...]:
+    return (_phase_flow_spec(), _ishikawa_spec())
+
+
+def __getattr__(name: str) -> tuple[DiagramSpec, ...]:
+    # SPECS is built on first access so importing the module stays cheap.
+    if name == "SPECS":
+        return _specs()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
 
 
 @dataclass(frozen=True)
@@ -241,6 +418,8 @@ def _emit_markdown(specs: Iterable[tuple[DiagramSpec, str]]) -> str:
 
 
 def _build_parser() -> argparse.ArgumentParser:
+    import argparse  # deferred until the CLI actually runs
+
     parser = argparse.ArgumentParser(description="Switcharoo Ishikawa diagram factory")
     parser.add_argument(
         "--output-dir", type=Path, help="Directory for .dot/.svg artifacts"
@@ -292,28 +471,27 @@ def main(argv: Sequence[str] | None = None) -> int:
     rendered: list[tuple[DiagramSpec, str]] = []
     target_dir = _target_directory(options)
 
+    specs = _specs()
     if target_dir is not None:
-        for spec in SPECS:
-            dot_source, dot_path, svg_path = _export_spec(
-                spec, target_dir, dot_binary=options.dot_binary
-            )
+        exported = _export_specs(specs, target_dir, dot_binary=options.dot_binary)
+        for spec, (dot_source, dot_path, svg_path, error) in zip(
+            specs, exported, strict=True
+        ):
             rendered.append((spec, dot_source))
             print(f"wrote {dot_path}")
             if svg_path:
                 print(f"wrote {svg_path}")
             else:
-                print("dot binary missing; SVG not created")
+                print(f"{error}; SVG not created")
     else:
-        for spec in SPECS:
-            builder = _build_diagram(spec, dot_binary=options.dot_binary)
-            rendered.append((spec, builder.dot_source()))
+        rendered.extend((spec, _dot_source_for(spec)) for spec in specs)
 
     if options.emit_markdown or options.markdown_path:
         blocks = _emit_markdown(rendered)
         if options.emit_markdown:
             print(blocks)
         if options.markdown_path:
-            options.markdown_path.write_text(blocks, encoding="utf-8")
+            options.markdown_path.write_bytes(blocks.encode("utf-8"))
 
     return 0
 
@@ -324,6 +502,7 @@ if __name__ == "__main__":
 
 __all__ = [
     "SPECS",
+    "AttrPairs",
     "AttrValue",
     "DiagramSpec",
     "EdgeSpec",
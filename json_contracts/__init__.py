@@ -5,6 +5,8 @@ from __future__ import annotations
 import sys as _sys
 from typing import TYPE_CHECKING
 
+from jsonschema import Draft202012Validator
+
 _NODE_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
@@ -88,8 +90,20 @@ ERROR_SCHEMA: dict[str, object] = {
     "additionalProperties": True,
 }
 
+# Compiled once so repeated validations skip schema walking and ref setup.
+INPUT_VALIDATOR = Draft202012Validator(INPUT_SCHEMA)
+OUTPUT_VALIDATOR = Draft202012Validator(OUTPUT_SCHEMA)
+ERROR_VALIDATOR = Draft202012Validator(ERROR_SCHEMA)
+
 # Preserve legacy import path "json_contracts" for downstream tooling.
 if not TYPE_CHECKING:
     _sys.modules.setdefault("json_contracts", _sys.modules[__name__])
 
-__all__ = ["ERROR_SCHEMA", "INPUT_SCHEMA", "OUTPUT_SCHEMA"]
+__all__ = [
+    "ERROR_SCHEMA",
+    "ERROR_VALIDATOR",
+    "INPUT_SCHEMA",
+    "INPUT_VALIDATOR",
+    "OUTPUT_SCHEMA",
+    "OUTPUT_VALIDATOR",
+]
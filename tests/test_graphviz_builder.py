@@ -41,6 +41,21 @@ def test_save_dot_includes_configuration(tmp_path: Path) -> None:
     assert 'weight="2"' in dot_source
 
 
+def test_batch_helpers_match_single_calls() -> None:
+    single = GraphvizBuilder().node_defaults(shape="box")
+    single.add_node("a", label="A")
+    single.add_node("b")
+    single.add_edge("a", "b")
+    single.add_edge("b", "c", color="red")
+
+    batched = GraphvizBuilder().node_defaults(shape="box")
+    batched.add_nodes_batch(["a", "b"], ["A", None])
+    batched.add_edges_batch([("a", "b")])
+    batched.add_edges_batch([("b", "c")], color="red")
+
+    assert batched.dot_source() == single.dot_source()
+
+
 def test_to_svg_falls_back_when_dot_missing(tmp_path: Path) -> None:
     builder = GraphvizBuilder()
 
@@ -9,10 +9,16 @@ from typing import cast
 import pytest
 from x_make_common_x.json_contracts import validate_payload, validate_schema
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 from x_make_graphviz_x.json_contracts import (
     ERROR_SCHEMA,
     INPUT_SCHEMA,
     OUTPUT_SCHEMA,
+    OUTPUT_VALIDATOR,
 )
 from x_make_graphviz_x.x_cls_make_graphviz_x import main_json
 
@@ -20,9 +26,14 @@ FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "json_contracts"
 REPORTS_DIR = Path(__file__).resolve().parents[1] / "reports"
 
 
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _load_json_object(path: Path) -> dict[str, object]:
-    with path.open("r", encoding="utf-8") as handle:
-        raw: object = json.load(handle)
+    raw = _loads(path.read_bytes())
     if not isinstance(raw, dict):
         message = f"Fixture {path} must contain a JSON object"
         raise TypeError(message)
@@ -30,16 +41,25 @@ def _load_json_object(path: Path) -> dict[str, object]:
 
 
 def _load_report_payload(path: Path) -> dict[str, object] | None:
-    with path.open("r", encoding="utf-8") as handle:
-        raw: object = json.load(handle)
+    raw = _loads(path.read_bytes())
     if isinstance(raw, dict):
         return cast("dict[str, object]", raw)
     return None
 
 
-SAMPLE_INPUT = _load_json_object(FIXTURE_DIR / "input.json")
-SAMPLE_OUTPUT = _load_json_object(FIXTURE_DIR / "output.json")
-SAMPLE_ERROR = _load_json_object(FIXTURE_DIR / "error.json")
+@pytest.fixture(scope="session")
+def sample_input() -> dict[str, object]:
+    return _load_json_object(FIXTURE_DIR / "input.json")
+
+
+@pytest.fixture(scope="session")
+def sample_output() -> dict[str, object]:
+    return _load_json_object(FIXTURE_DIR / "output.json")
+
+
+@pytest.fixture(scope="session")
+def sample_error() -> dict[str, object]:
+    return _load_json_object(FIXTURE_DIR / "error.json")
 
 
 def test_schemas_are_valid() -> None:
@@ -47,10 +67,14 @@ def test_schemas_are_valid() -> None:
         validate_schema(schema)
 
 
-def test_sample_payloads_match_schema() -> None:
-    validate_payload(SAMPLE_INPUT, INPUT_SCHEMA)
-    validate_payload(SAMPLE_OUTPUT, OUTPUT_SCHEMA)
-    validate_payload(SAMPLE_ERROR, ERROR_SCHEMA)
+def test_sample_payloads_match_schema(
+    sample_input: dict[str, object],
+    sample_output: dict[str, object],
+    sample_error: dict[str, object],
+) -> None:
+    validate_payload(sample_input, INPUT_SCHEMA)
+    validate_payload(sample_output, OUTPUT_SCHEMA)
+    validate_payload(sample_error, ERROR_SCHEMA)
 
 
 def test_existing_reports_align_with_schema() -> None:
@@ -62,11 +86,11 @@ def test_existing_reports_align_with_schema() -> None:
     for report_file in report_files:
         payload = _load_report_payload(report_file)
         if payload is not None:
-            validate_payload(payload, OUTPUT_SCHEMA)
+            OUTPUT_VALIDATOR.validate(payload)
 
 
-def test_main_json_executes_happy_path() -> None:
-    result = main_json(SAMPLE_INPUT)
+def test_main_json_executes_happy_path(sample_input: dict[str, object]) -> None:
+    result = main_json(sample_input)
     validate_payload(result, OUTPUT_SCHEMA)
     status_value = result.get("status")
     assert isinstance(status_value, str)
@@ -74,8 +98,10 @@ def test_main_json_executes_happy_path() -> None:
     assert "dot_source" in result
 
 
-def test_main_json_returns_error_for_invalid_payload() -> None:
-    invalid = copy.deepcopy(SAMPLE_INPUT)
+def test_main_json_returns_error_for_invalid_payload(
+    sample_input: dict[str, object],
+) -> None:
+    invalid = copy.deepcopy(sample_input)
     parameters = invalid.get("parameters")
     if isinstance(parameters, dict):
         parameters.pop("nodes", None)
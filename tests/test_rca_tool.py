@@ -4,11 +4,15 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pytest
 
 from x_make_graphviz_x.examples import rca_tool
@@ -18,34 +22,38 @@ class _FakeBuilder:
     """Minimal stub that imitates GraphvizBuilder for CLI tests."""
 
     def __init__(self, *_args: object, **_kwargs: object) -> None:
-        self._dot_lines: list[str] = ["digraph G {", "  // fake", "}"]
-
-    def graph_attr(self, **_attrs: object) -> _FakeBuilder:
-        return self
+        self._buf = io.StringIO()
+        self._buf.write("digraph G {\n  // fake\n}")
 
-    def node_defaults(self, **_attrs: object) -> _FakeBuilder:
-        return self
+    def __getattr__(self, name: str) -> Callable[..., _FakeBuilder]:
+        # Any builder method not defined below is a chainable no-op; cache it
+        # on the instance so later lookups skip __getattr__ entirely.
+        if name.startswith("__"):
+            raise AttributeError(name)
 
-    def add_node(self, *_args: object, **_kwargs: object) -> _FakeBuilder:
-        return self
+        def _chain(*_args: object, **_kwargs: object) -> _FakeBuilder:
+            return self
 
-    def add_edge(self, *_args: object, **_kwargs: object) -> _FakeBuilder:
-        return self
-
-    def rank(self, *_args: object, **_kwargs: object) -> _FakeBuilder:
-        return self
+        object.__setattr__(self, name, _chain)
+        return _chain
 
     def dot_source(self) -> str:
-        return "\n".join(self._dot_lines)
-
-    def to_svg(self, base_path: str) -> str:
-        svg_path = Path(f"{base_path}.svg")
-        svg_path.write_text("<svg/>", encoding="utf-8")
+        return self._buf.getvalue()
+
+    def to_svg(self, base_path: str, *, dot_source: str | None = None) -> str:
+        del dot_source
+        # Mirror GraphvizBuilder.to_svg, which drops any suffix to get the stem.
+        target = Path(base_path)
+        svg_path = (
+            target.with_suffix(".svg") if target.suffix else Path(f"{base_path}.svg")
+        )
+        svg_path.write_bytes(b"<svg/>")
         return str(svg_path)
 
 
-def _sample_payload() -> dict[str, object]:
-    return {
+# Read-only: tests that need to mutate the payload should copy.deepcopy it.
+_SAMPLE_PAYLOAD: Final = MappingProxyType(
+    {
         "incident": {
             "title": "Sample RCA",
             "slug": "sample-rca",
@@ -81,10 +89,11 @@ def _sample_payload() -> dict[str, object]:
             }
         ],
     }
+)
 
 
 def test_markdown_includes_remediation_tracker() -> None:
-    payload = _sample_payload()
+    payload = rca_tool.Payload.from_raw(_SAMPLE_PAYLOAD)
     markdown = rca_tool._markdown(  # noqa: SLF001 - verifying helper output
         payload,
         slug="sample-rca",
@@ -106,7 +115,7 @@ def test_main_exports_artifacts_with_stub(
     monkeypatch.setattr(rca_tool, "GraphvizBuilder", _FakeBuilder)
 
     payload_path = tmp_path / "payload.json"
-    payload_path.write_text(json.dumps(_sample_payload()), encoding="utf-8")
+    payload_path.write_text(json.dumps(dict(_SAMPLE_PAYLOAD)), encoding="utf-8")
 
     output_dir = tmp_path / "out"
     markdown_path = tmp_path / "packet.md"
@@ -136,3 +145,33 @@ def test_main_exports_artifacts_with_stub(
     assert markdown_path.exists()
     markdown = markdown_path.read_text(encoding="utf-8")
     assert "## Remediation Tracker" in markdown
+
+
+def test_main_keeps_dotted_slug_in_svg_names(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(rca_tool, "GraphvizBuilder", _FakeBuilder)
+
+    payload_path = tmp_path / "payload.json"
+    payload_path.write_text(json.dumps(dict(_SAMPLE_PAYLOAD)), encoding="utf-8")
+    output_dir = tmp_path / "out"
+
+    exit_code = rca_tool.main(
+        [
+            "--input",
+            str(payload_path),
+            "--output-dir",
+            str(output_dir),
+            "--subdir",
+            "demo",
+            "--slug",
+            "rel-1.2",
+        ]
+    )
+
+    assert exit_code == 0
+    artifact_dir = output_dir / "demo"
+    for kind in ("phase-flow", "ishikawa"):
+        assert (artifact_dir / f"rel-1.2-{kind}.dot").exists()
+        assert (artifact_dir / f"rel-1.2-{kind}.svg").exists()
+    assert not (artifact_dir / "rel-1.svg").exists()
@@ -0,0 +1,130 @@
+"""Tests for the Switcharoo Ishikawa diagram factory."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pytest
+
+from x_make_graphviz_x.examples import switcharoo_ishikawa_factory as factory
+
+
+def _spec(label: str) -> factory.DiagramSpec:
+    return factory.DiagramSpec(
+        name="demo",
+        filename="demo",
+        nodes=(factory.NodeSpec("a", label=label),),
+    )
+
+
+def _fake_render(
+    _dot_binary: str, dot_paths: Sequence[Path]
+) -> tuple[list[Path | None], str | None]:
+    svg_paths: list[Path | None] = []
+    for dot_path in dot_paths:
+        svg_path = dot_path.with_suffix(".svg")
+        svg_path.write_bytes(dot_path.read_bytes())
+        svg_paths.append(svg_path)
+    return svg_paths, None
+
+
+def _failed_render(
+    _dot_binary: str, dot_paths: Sequence[Path]
+) -> tuple[list[Path | None], str | None]:
+    return [None] * len(dot_paths), "dot failed: boom"
+
+
+def test_failed_render_is_not_reused_as_unchanged(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(factory, "_export_single", lambda *_a, **_k: None)
+
+    monkeypatch.setattr(factory, "_render_batch", _fake_render)
+    factory._export_specs([_spec("old")], tmp_path, dot_binary="dot")
+
+    monkeypatch.setattr(factory, "_render_batch", _failed_render)
+    [(_, _, svg_path, error)] = factory._export_specs(
+        [_spec("new")], tmp_path, dot_binary="dot"
+    )
+    assert svg_path is None
+    assert error == "dot failed: boom"
+    assert not (tmp_path / "demo.svg").exists()
+
+    monkeypatch.setattr(factory, "_render_batch", _fake_render)
+    [(_, dot_path, svg_path, error)] = factory._export_specs(
+        [_spec("new")], tmp_path, dot_binary="dot"
+    )
+    assert error is None
+    assert svg_path is not None
+    assert svg_path.read_bytes() == dot_path.read_bytes()
+
+
+def test_specs_accept_mapping_attributes() -> None:
+    from_mappings = factory.DiagramSpec(
+        name="demo",
+        filename="demo",
+        graph_attrs={"rankdir": "LR"},
+        nodes=[factory.NodeSpec("a", attributes={"shape": "box"})],
+        edges=[factory.EdgeSpec("a", "b", attributes={"color": "red"})],
+        rank_groups=[["a", "b"]],
+    )
+    from_pairs = factory.DiagramSpec(
+        name="demo",
+        filename="demo",
+        graph_attrs=(("rankdir", "LR"),),
+        nodes=(factory.NodeSpec("a", attributes=(("shape", "box"),)),),
+        edges=(factory.EdgeSpec("a", "b", attributes=(("color", "red"),)),),
+        rank_groups=(("a", "b"),),
+    )
+
+    assert from_mappings == from_pairs
+    assert factory._dot_source_for(from_mappings) == factory._dot_source_for(from_pairs)
+
+
+def test_render_batch_ignores_stale_outputs(tmp_path: Path) -> None:
+    dot_path = tmp_path / "demo.dot"
+    dot_path.write_bytes(b"digraph G {}")
+    Path(f"{dot_path}.svg").write_bytes(b"<svg>stale</svg>")
+
+    # The interpreter rejects dot's flags, standing in for a dot that fails.
+    svg_paths, error = factory._render_batch(sys.executable, [dot_path])
+
+    assert svg_paths == [None]
+    assert error is not None
+    assert not (tmp_path / "demo.svg").exists()
+
+
+def test_only_unrendered_specs_are_retried(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def _render_first(
+        _dot_binary: str, dot_paths: Sequence[Path]
+    ) -> tuple[list[Path | None], str | None]:
+        first = dot_paths[0].with_suffix(".svg")
+        first.write_bytes(b"<svg/>")
+        return [first, *([None] * (len(dot_paths) - 1))], "dot failed: boom"
+
+    retried: list[Path] = []
+
+    def _record_retry(
+        written: tuple[factory.DiagramSpec, str, Path], **_kwargs: object
+    ) -> None:
+        retried.append(written[2])
+
+    monkeypatch.setattr(factory.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(factory, "_render_batch", _render_first)
+    monkeypatch.setattr(factory, "_export_single", _record_retry)
+    specs = [
+        factory.DiagramSpec(name="one", filename="one"),
+        factory.DiagramSpec(name="two", filename="two"),
+    ]
+
+    rows = factory._export_specs(specs, tmp_path, dot_binary="dot")
+
+    assert retried == [tmp_path / "two.dot"]
+    assert [error for *_, error in rows] == [None, "dot failed: boom"]
@@ -42,3 +42,13 @@ def test_vendored_dot_binaries_sorted(monkeypatch: MonkeyPatch) -> None:
 
     if binaries != tuple(sorted(binaries)):
         pytest.fail("vendored binaries should be returned in sorted order")
+
+
+def test_vendored_dot_binaries_empty_off_windows(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(vendor_support, "_is_windows", lambda: False)
+
+    if vendor_support.vendored_dot_binaries() != ():
+        pytest.fail("expected no vendored binaries off Windows without force=True")
+    forced = vendor_support.vendored_dot_binaries(force=True)
+    if forced != tuple(sorted(forced)):
+        pytest.fail("forced vendored binaries should be returned in sorted order")
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from collections.abc import Iterable
-from functools import cache
+from functools import cache, lru_cache
 from pathlib import Path
 
+_DOT_NAMES = frozenset(("dot", "dot.exe"))
+
 
 def _package_root() -> Path:
     return Path(__file__).resolve().parent
@@ -16,62 +19,83 @@ def _vendor_root() -> Path:
     return _package_root() / "vendor"
 
 
-def _iter_paths(root: Path, patterns: Iterable[str]) -> list[Path]:
+def _find_binaries(root: Path, names: frozenset[str]) -> list[Path]:
     candidates: list[Path] = []
-    if not root.exists():
-        return candidates
-    for pattern in patterns:
-        candidates.extend(root.rglob(pattern))
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name in names and entry.is_file():
+                        candidates.append(Path(entry.path))
+        except OSError:
+            continue
     return candidates
 
 
 def _normalize_candidates(candidates: Iterable[Path]) -> tuple[Path, ...]:
     normalized: list[Path] = []
-    seen: set[Path] = set()
+    seen: set[str] = set()
     for candidate in candidates:
-        try:
-            resolved = candidate.resolve()
-        except OSError:
-            continue
-        if not resolved.is_file():
+        # Candidates come from the already-resolved vendor root, so a lexical
+        # key is enough for dedup and avoids a resolve() syscall per path.
+        key = os.path.normcase(os.path.normpath(candidate))
+        if key in seen:
             continue
-        if resolved in seen:
-            continue
-        normalized.append(resolved)
-        seen.add(resolved)
+        normalized.append(candidate)
+        seen.add(key)
     return tuple(sorted(normalized))
 
 
 @cache
-def vendored_dot_binaries() -> tuple[Path, ...]:
-    """Return every vendored Graphviz `dot` binary bundled with this package."""
+def _scan_vendored_dot_binaries() -> tuple[Path, ...]:
+    return _normalize_candidates(_find_binaries(_vendor_root(), _DOT_NAMES))
 
-    vendor_root = _vendor_root()
-    patterns = ("dot.exe", "dot")
-    return _normalize_candidates(_iter_paths(vendor_root, patterns))
 
+def vendored_dot_binaries(*, force: bool = False) -> tuple[Path, ...]:
+    """Return every vendored Graphviz `dot` binary bundled with this package.
 
-def _is_windows() -> bool:
-    return sys.platform.startswith("win")
+    The bundled distribution only targets Windows, so other platforms get an
+    empty tuple without walking the vendor tree unless ``force`` is set.
+    """
 
+    if not force and not _is_windows():
+        return ()
+    return _scan_vendored_dot_binaries()
 
-def find_vendored_dot_binary(*, windows_only: bool = True) -> Path | None:
-    """Return the preferred vendored dot binary if available."""
 
-    if windows_only and not _is_windows():
-        return None
+@cache
+def _vendored_index() -> tuple[tuple[Path, ...], Path | None]:
+    binaries = _scan_vendored_dot_binaries()
+    first_exe = next((p for p in binaries if p.suffix.lower() == ".exe"), None)
+    return binaries, first_exe
+
+
+@cache
+def _is_windows() -> bool:
+    return sys.platform.startswith("win")
 
-    binaries = vendored_dot_binaries()
-    if not binaries:
+
+@lru_cache(maxsize=4)
+def _find_vendored_dot_binary(*, is_windows: bool, windows_only: bool) -> Path | None:
+    if windows_only and not is_windows:
         return None
 
+    binaries, first_exe = _vendored_index()
     if windows_only:
-        for candidate in binaries:
-            if candidate.suffix.lower() == ".exe":
-                return candidate
-        return None
+        return first_exe
+    return binaries[0] if binaries else None
+
+
+def find_vendored_dot_binary(*, windows_only: bool = True) -> Path | None:
+    """Return the preferred vendored dot binary if available."""
 
-    return binaries[0]
+    return _find_vendored_dot_binary(
+        is_windows=_is_windows(), windows_only=windows_only
+    )
 
 
 __all__ = ["find_vendored_dot_binary", "vendored_dot_binaries"]
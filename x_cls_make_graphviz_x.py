@@ -9,7 +9,6 @@ record/HTML labels, ports, and rich attributes.
 
 from __future__ import annotations
 
-import argparse
 import importlib
 import json
 import logging
@@ -26,9 +25,8 @@ from x_make_common_x.exporters import (
     ExportResult,
     export_graphviz_to_svg,
 )
-from x_make_common_x.json_contracts import validate_payload
 
-from x_make_graphviz_x.json_contracts import INPUT_SCHEMA, OUTPUT_SCHEMA
+from x_make_graphviz_x.json_contracts import INPUT_VALIDATOR, OUTPUT_VALIDATOR
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -73,16 +71,27 @@ def _esc(s: str) -> str:
     return str(s).replace('"', r"\"")
 
 
+def _attr_pair(key: str, value: AttrValue) -> str:
+    text = "true" if value is True else "false" if value is False else str(value)
+    return f'{key}="{_esc(text)}"'
+
+
+def _attr_pairs(data: Mapping[str, AttrValue]) -> list[str]:
+    return [_attr_pair(key, value) for key, value in data.items() if value is not None]
+
+
 def _attrs(data: Mapping[str, AttrValue] | None) -> str:
     if not data:
         return ""
-    pairs: list[str] = []
-    for key, value in data.items():
-        if value is None:
-            continue
-        text = "true" if value is True else "false" if value is False else str(value)
-        pairs.append(f'{key}="{_esc(text)}"')
-    return " [" + ", ".join(pairs) + "]"
+    return " [" + ", ".join(_attr_pairs(data)) + "]"
+
+
+def _map_url_alias(attrs: dict[str, AttrValue]) -> None:
+    # Map convenience keys to DOT/SVG hyperlink attributes
+    if "url" in attrs and "URL" not in attrs:
+        attrs["URL"] = attrs.pop("url")
+    if "href" in attrs and "URL" not in attrs:
+        attrs["URL"] = attrs.pop("href")
 
 
 class _Subgraph:
@@ -207,12 +216,14 @@ class GraphvizBuilder:
         label: str | None = None,
         **attrs: AttrValue,
     ) -> GraphvizBuilder:
-        # Map convenience keys to DOT/SVG hyperlink attributes
-        if "url" in attrs and "URL" not in attrs:
-            attrs["URL"] = attrs.pop("url")
-        if "href" in attrs and "URL" not in attrs:
-            attrs["URL"] = attrs.pop("href")
-        # ...existing code...
+        if not attrs:
+            # Fast path for label-only nodes, which inherit node_defaults.
+            if label is None:
+                self._nodes.append(f'"{_esc(node_id)}"')
+            else:
+                self._nodes.append(f'"{_esc(node_id)}" [label="{_esc(label)}"]')
+            return self
+        _map_url_alias(attrs)
         if label is not None and "label" not in attrs:
             attrs["label"] = label
         self._nodes.append(f'"{_esc(node_id)}"{_attrs(attrs)}')
@@ -227,12 +238,7 @@ class GraphvizBuilder:
         to_port: str | None = None,
         **attrs: AttrValue,
     ) -> GraphvizBuilder:
-        # Map convenience keys to DOT/SVG hyperlink attributes
-        if "url" in attrs and "URL" not in attrs:
-            attrs["URL"] = attrs.pop("url")
-        if "href" in attrs and "URL" not in attrs:
-            attrs["URL"] = attrs.pop("href")
-        # ...existing code...
+        _map_url_alias(attrs)
         arrow = "->" if self._directed else "--"
         lhs = f'"{_esc(src)}"{":" + from_port if from_port else ""}'
         rhs = f'"{_esc(dst)}"{":" + to_port if to_port else ""}'
@@ -241,6 +247,39 @@ class GraphvizBuilder:
         self._edges.append(f"{lhs} {arrow} {rhs}{_attrs(attrs)}")
         return self
 
+    def add_nodes_batch(
+        self,
+        node_ids: Sequence[str],
+        labels: Sequence[str | None] | None = None,
+        **attrs: AttrValue,
+    ) -> GraphvizBuilder:
+        """Add nodes sharing one attribute set, with optional per-node labels."""
+        _map_url_alias(attrs)
+        shared = _attr_pairs(attrs)
+        if labels is None or "label" in attrs:
+            suffix = " [" + ", ".join(shared) + "]" if shared else ""
+            self._nodes.extend(f'"{_esc(node_id)}"{suffix}' for node_id in node_ids)
+            return self
+        for node_id, label in zip(node_ids, labels, strict=True):
+            pairs = shared if label is None else [*shared, _attr_pair("label", label)]
+            suffix = " [" + ", ".join(pairs) + "]" if pairs else ""
+            self._nodes.append(f'"{_esc(node_id)}"{suffix}')
+        return self
+
+    def add_edges_batch(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        **attrs: AttrValue,
+    ) -> GraphvizBuilder:
+        """Add many port-less edges sharing one attribute set."""
+        _map_url_alias(attrs)
+        arrow = "->" if self._directed else "--"
+        suffix = _attrs(attrs)
+        self._edges.extend(
+            f'"{_esc(src)}" {arrow} "{_esc(dst)}"{suffix}' for src, dst in pairs
+        )
+        return self
+
     def add_raw(self, line: str) -> GraphvizBuilder:
         """Append a raw DOT line at top level (advanced)."""
         self._nodes.append(line)
@@ -380,7 +419,7 @@ class GraphvizBuilder:
             return str(out_path)
         except Exception:  # noqa: BLE001 - fallback to DOT is intentional
             dot_path = Path(f"{output_file}.dot")
-            dot_path.write_text(dot, encoding="utf-8")
+            dot_path.write_bytes(dot.encode("utf-8"))
             if self._is_verbose():
                 _info(f"[graphviz] wrote DOT fallback to {dot_path}")
             return dot
@@ -390,13 +429,20 @@ class GraphvizBuilder:
     def save_dot(self, path: str) -> str:
         dot = self._dot_source()
         target = Path(path)
-        target.write_text(dot, encoding="utf-8")
+        target.write_bytes(dot.encode("utf-8"))
         return str(target)
 
-    def to_svg(self, output_basename: str = "graph") -> str | None:
+    def to_svg(
+        self,
+        output_basename: str = "graph",
+        *,
+        dot_source: str | None = None,
+    ) -> str | None:
         """Render SVG via graphviz if available.
 
-        Returns the SVG path on success or ``None`` when falling back to a DOT file.
+        Pass ``dot_source`` when the caller already holds :meth:`dot_source` output
+        to skip regenerating it. Returns the SVG path on success or ``None`` when
+        falling back to a DOT file.
         """
         target_path = Path(output_basename)
         if target_path.suffix:
@@ -406,7 +452,7 @@ class GraphvizBuilder:
             stem = target_path.name
             output_dir = target_path.parent or Path()
         result = export_graphviz_to_svg(
-            self._dot_source(),
+            dot_source if dot_source is not None else self._dot_source(),
             output_dir=output_dir,
             stem=stem,
             graphviz_path=self._dot_binary,
@@ -508,7 +554,7 @@ def _failure_payload(
 
 def _validate_input_schema(payload: Mapping[str, object]) -> dict[str, object] | None:
     try:
-        validate_payload(payload, INPUT_SCHEMA)
+        INPUT_VALIDATOR.validate(payload)
     except ValidationError as exc:
         return _failure_payload(
             "input payload failed validation",
@@ -523,7 +569,7 @@ def _validate_input_schema(payload: Mapping[str, object]) -> dict[str, object] |
 
 def _validate_output_schema(result: Mapping[str, object]) -> dict[str, object] | None:
     try:
-        validate_payload(result, OUTPUT_SCHEMA)
+        OUTPUT_VALIDATOR.validate(result)
     except ValidationError as exc:
         return _failure_payload(
             "generated output failed schema validation",
@@ -653,6 +699,8 @@ def _load_json_payload(file_path: str | None) -> Mapping[str, object]:
 
 
 def _run_json_cli(args: Sequence[str]) -> None:
+    import argparse  # only the JSON CLI needs argparse
+
     parser = argparse.ArgumentParser(description="x_make_graphviz_x JSON runner")
     parser.add_argument(
         "--json", action="store_true", help="Read JSON payload from stdin"